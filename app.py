@@ -2,22 +2,57 @@
 Smart Farming Assistant - Streamlit Application (Pure Python Version)
 Powered by Google Gemini AI
 
-Installation:
-pip install streamlit google-generativeai
+Installation (Python 3.11 or 3.12):
+pip install -r requirements.txt
 
 Usage:
 1. Add your Gemini API key to Streamlit secrets (.streamlit/secrets.toml)
 2. Run: streamlit run app.py
+   (.streamlit/config.toml disables the file watcher; for live reload use
+   streamlit run app.py --server.fileWatcherType auto --server.runOnSave true)
+3. Optionally, before deploying, run: python scripts/warm_cache.py
+   (precomputes answers to the sample prompts into warm_cache.json)
 
 Streamlit Secrets Setup:
 Create .streamlit/secrets.toml file with:
 GEMINI_API_KEY = "your_api_key_here"
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import hashlib
+import logging
+import os
+import queue
+import threading
+import time
+
+import cachetools
+import faiss
+import numpy as np
+import orjson
 import streamlit as st
-import google.generativeai as genai
 from datetime import datetime
 
+from farming_data import (
+    BASE_SYSTEM_PROMPT,
+    DEFAULT_SAMPLE_PROMPTS,
+    FEATURE_TITLES,
+    FEATURES,
+    GENERATION_CONFIG,
+    MODEL_NAME,
+    OFFERED_SAMPLE_PROMPTS,
+    SAMPLE_PROMPT_LIMIT,
+    SAMPLE_PROMPTS,
+    SYSTEM_PROMPTS,
+    WARM_CACHE_PROMPTS,
+    warm_cache_key,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("agronova")
+
 # =============================================================================
 # PAGE CONFIGURATION
 # =============================================================================
@@ -31,10 +66,15 @@ st.set_page_config(
 # =============================================================================
 # CONFIGURATION - USING STREAMLIT SECRETS
 # =============================================================================
+# Values copied verbatim from the setup instructions rather than a real key
+PLACEHOLDER_API_KEYS = {"your_api_key_here", "YOUR_GEMINI_API_KEY_HERE"}
+
 try:
     app_key = st.secrets["GEMINI_API_KEY"]
-    genai.configure(api_key=app_key)
-except Exception as e:
+except Exception:
+    app_key = None
+
+if not app_key or app_key in PLACEHOLDER_API_KEYS:
     st.error("⚠️ **Gemini API Key Not Found!**")
     st.info("""
     Please add your API key to Streamlit secrets:
@@ -51,183 +91,463 @@ except Exception as e:
     """)
     st.stop()
 
-# Configure the Gemini model
-generation_config = {
-    "temperature": 0.7,
-    "top_p": 0.95,
-    "top_k": 40,
-    "max_output_tokens": 2048,
-}
-
-model = genai.GenerativeModel(
-    model_name="gemini-2.5-flash",
-    generation_config=generation_config,
-)
-
-# =============================================================================
-# DATA STRUCTURES
-# =============================================================================
-
-FEATURES = [
-    {
-        "id": "crop-recommendation",
-        "title": "🌾 Crop Recommendation",
-        "description": "Get suggestions for crops based on your location, season, and soil type",
-        "color": "#d1fae5"
-    },
-    {
-        "id": "pest-disease",
-        "title": "🐛 Pest & Disease Management",
-        "description": "Identify and treat crop diseases and pest infestations",
-        "color": "#fee2e2"
-    },
-    {
-        "id": "weather-alerts",
-        "title": "🌦️ Weather-Based Alerts",
-        "description": "Get weather forecasts and farming advice based on conditions",
-        "color": "#dbeafe"
-    },
-    {
-        "id": "soil-fertilizer",
-        "title": "🌱 Soil & Fertilizer Advice",
-        "description": "Receive recommendations for soil treatment and fertilization",
-        "color": "#fef3c7"
-    },
-    {
-        "id": "sustainable-farming",
-        "title": "♻️ Sustainable Farming Tips",
-        "description": "Learn eco-friendly and organic farming practices",
-        "color": "#d1fae5"
-    }
-]
-
-SAMPLE_PROMPTS = {
-    "crop-recommendation": [
-        "Suggest crops to plant in July in Tamil Nadu",
-        "What should I grow in acidic soil in Odisha in September?",
-        "Best crops for monsoon season in Kerala",
-        "Crop recommendation for sandy soil in Rajasthan"
-    ],
-    "pest-disease": [
-        "White fungus on wheat leaves in Haryana – treatment?",
-        "How to treat aphids on tomato plants organically?",
-        "Yellow spots on rice leaves - what is it?",
-        "Pest control for cotton crops in Maharashtra"
-    ],
-    "weather-alerts": [
-        "Rain prediction and farming advice for Punjab this week?",
-        "Weather forecast for harvesting season in Karnataka",
-        "Should I irrigate my crops this week in Gujarat?",
-        "Best time to apply fertilizer based on weather in UP"
-    ],
-    "soil-fertilizer": [
-        "What should I grow in slightly acidic soil in Kenya?",
-        "NPK fertilizer ratio for wheat cultivation",
-        "How to improve clay soil for vegetable farming?",
-        "Organic fertilizer recommendations for sugarcane"
-    ],
-    "sustainable-farming": [
-        "Give eco-friendly pest control methods for grapes in Italy",
-        "Organic farming practices for small-scale farmers",
-        "Water conservation techniques for paddy fields",
-        "Companion planting guide for vegetables"
-    ]
-}
+@st.cache_resource(show_spinner=False)
+def get_genai():
+    """Import and configure the Gemini SDK once per process, on first use
+
+    The SDK pulls in gRPC and protobuf, so importing it lazily keeps it off
+    the startup path; configuring only once keeps its cached clients.
+    """
+    import google.generativeai as genai
+
+    genai.configure(api_key=st.secrets["GEMINI_API_KEY"])
+    return genai
+
+# Gemini requests in flight at once per process (keep under the API tier's
+# rate limit) and how long to wait on a request before giving up
+GEMINI_MAX_CONCURRENCY = 16
+GEMINI_TIMEOUT = 60
+
+# While waiting on Gemini the script returns to Streamlit this often;
+# only then can a rerun (the user moving on) stop it
+STREAM_POLL_SECONDS = 0.5
+
+# Number of recent chat messages (two question/answer turns) sent verbatim
+# as context; earlier questions are condensed into a one-line summary
+HISTORY_WINDOW = 4
+SUMMARY_MAX_QUESTIONS = 5
+SUMMARY_QUESTION_CHARS = 100
+
+# Exact-match response cache keyed by a hash of feature, message and
+# history; checked before the semantic cache. Entries expire so that
+# time-sensitive advice (weather, seasons) is refreshed
+EXACT_CACHE_SIZE = 2048
+EXACT_CACHE_TTL_SECONDS = 3600
+
+# Semantic response cache: near-duplicate questions reuse an earlier answer.
+# Entries expire like exact ones, or an identical question would keep
+# getting the stale answer through this cache
+EMBEDDING_MODEL = "models/gemini-embedding-001"
+# The model's embeddings can be truncated; 768 dimensions keep the index small
+EMBEDDING_DIMENSIONS = 768
+SEMANTIC_CACHE_THRESHOLD = 0.9
+SEMANTIC_CACHE_NEIGHBOURS = 4
+SEMANTIC_CACHE_INDEX_PATH = "semantic_cache.faiss"
+SEMANTIC_CACHE_DATA_PATH = "semantic_cache.json"
+SEMANTIC_CACHE_TTL_SECONDS = EXACT_CACHE_TTL_SECONDS
+
+# Answers to the sample prompts, generated at deploy time by scripts/warm_cache.py
+WARM_CACHE_PATH = "warm_cache.json"
+
+HEADER_MARKDOWN = """# 🌾 AgroNova
+#### Smart Farming Assistant powered by Gemini AI
+---"""
+
+# Sidebar entry for questions outside any specific feature
+GENERAL_FEATURE_TITLE = "💬 General Farming Questions"
+GENERAL_FEATURE_CAPTION = "Ask about any farming topic"
+
+# Chat avatar for each message role
+AVATARS = {"user": "👤", "assistant": "🌾"}
 
 # =============================================================================
 # SESSION STATE INITIALIZATION
 # =============================================================================
 
-if "messages" not in st.session_state:
-    st.session_state.messages = [
-        {
-            "role": "assistant",
-            "content": """Welcome to AgroNova Smart Farming Assistant! 🌾
+WELCOME_MESSAGE = """Welcome to AgroNova Smart Farming Assistant! 🌾
 
 I'm here to help farmers worldwide with AI-powered agricultural advice. Ask me about crops, pests, weather, soil, or sustainable farming practices in your region.
 
 **Select a feature from the sidebar or ask me anything!**"""
-        }
-    ]
+
+# The conversation is kept as parallel lists: roles[i] wrote contents[i]
+if "roles" not in st.session_state:
+    st.session_state.roles = ["assistant"]
+    st.session_state.contents = [WELCOME_MESSAGE]
 
 if "selected_feature" not in st.session_state:
     st.session_state.selected_feature = None
 
+if "history_summary" not in st.session_state:
+    st.session_state.history_summary = ""
+
+# =============================================================================
+# EXACT RESPONSE CACHE
+# =============================================================================
+
+class ExactCache:
+    """Thread-safe LRU of responses keyed by response_key(), with per-entry expiry"""
+
+    def __init__(self, maxsize, ttl):
+        self._entries = cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached response for key, or None"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, response):
+        """Store a response under key, evicting the least recently used entry"""
+        with self._lock:
+            self._entries[key] = response
+
+@st.cache_resource(show_spinner=False)
+def get_exact_cache():
+    """Process-wide exact-match response cache"""
+    return ExactCache(EXACT_CACHE_SIZE, EXACT_CACHE_TTL_SECONDS)
+
+class InflightRequests:
+    """Futures for requests currently being answered, so duplicates can wait on them"""
+
+    def __init__(self):
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key):
+        """Return the future for key and whether the caller should produce its result"""
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return future, False
+            future = concurrent.futures.Future()
+            self._futures[key] = future
+            return future, True
+
+    def release(self, key, future):
+        """Forget the future for key once its result is cached, unless a new request took over"""
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+class RequestInterrupted(Exception):
+    """The session answering a request stopped before the reply finished"""
+
+@st.cache_resource(show_spinner=False)
+def get_inflight_requests():
+    """Process-wide registry of in-flight Gemini requests"""
+    return InflightRequests()
+
+@st.cache_resource(show_spinner=False)
+def get_warm_cache():
+    """Precomputed sample prompt answers, or an empty mapping if none were generated"""
+    if not os.path.exists(WARM_CACHE_PATH):
+        return {}
+    try:
+        with open(WARM_CACHE_PATH, "rb") as f:
+            answers = orjson.loads(f.read())
+    except Exception:
+        logger.warning("Could not load warm cache from %s", WARM_CACHE_PATH, exc_info=True)
+        return {}
+    # Answers would never expire, so only prompts whose answers don't go
+    # stale are served, even if an older file holds others
+    keys = {warm_cache_key(feature_id, prompt) for feature_id, prompt in WARM_CACHE_PROMPTS}
+    return {key: answer for key, answer in answers.items() if key in keys}
+
+# =============================================================================
+# SEMANTIC RESPONSE CACHE
+# =============================================================================
+
+def embed_texts(texts):
+    """Embed texts in one batched call as L2-normalised rows, so inner product equals cosine similarity"""
+    result = get_genai().embed_content(
+        model=EMBEDDING_MODEL,
+        content=list(texts),
+        task_type="semantic_similarity",
+        output_dimensionality=EMBEDDING_DIMENSIONS
+    )
+    vectors = np.asarray(result["embedding"], dtype="float32")
+    faiss.normalize_L2(vectors)
+    return vectors
+
+def embed_text(text):
+    """Embed a single text as a one-row matrix"""
+    return embed_texts([text])
+
+class SemanticCache:
+    """FAISS index of question embeddings mapped to the responses they produced"""
+
+    def __init__(self, index=None, features=None, responses=None, created=None):
+        self.index = index
+        self.features = features or []
+        self.responses = responses or []
+        # Wall-clock time each entry was added, so expiry survives a restart
+        self.created = created or [0.0] * len(self.responses)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.responses)
+
+    @classmethod
+    def load(cls, index_path, data_path):
+        """Restore a cache written by save(), or start empty"""
+        if not (os.path.exists(index_path) and os.path.exists(data_path)):
+            return cls()
+        try:
+            with open(data_path, "rb") as f:
+                data = orjson.loads(f.read())
+            # Vectors from another embedding model can't be compared with new ones
+            if data.get("model") != EMBEDDING_MODEL:
+                logger.info("Discarding semantic cache built with another embedding model")
+                return cls()
+            cache = cls(
+                faiss.read_index(index_path),
+                data["features"],
+                data["responses"],
+                data.get("created")
+            )
+        except Exception:
+            logger.warning("Could not load semantic cache from %s", index_path, exc_info=True)
+            return cls()
+        with cache._lock:
+            cache._evict_expired()
+        return cache
+
+    def _evict_expired(self):
+        """Drop entries older than the TTL; the caller holds the lock"""
+        cutoff = time.time() - SEMANTIC_CACHE_TTL_SECONDS
+        expired = [idx for idx, created in enumerate(self.created) if created < cutoff]
+        if not expired:
+            return
+        # A flat index renumbers the remaining vectors in order, matching the lists
+        self.index.remove_ids(np.asarray(expired, dtype="int64"))
+        keep = [idx for idx, created in enumerate(self.created) if created >= cutoff]
+        self.features = [self.features[idx] for idx in keep]
+        self.responses = [self.responses[idx] for idx in keep]
+        self.created = [self.created[idx] for idx in keep]
+
+    def lookup(self, vector, feature):
+        """Return the cached response for a similar question on the same feature"""
+        with self._lock:
+            if self.index is None or self.index.ntotal == 0:
+                return None
+            scores, ids = self.index.search(vector, SEMANTIC_CACHE_NEIGHBOURS)
+            for score, idx in zip(scores[0], ids[0]):
+                if idx < 0 or score < SEMANTIC_CACHE_THRESHOLD:
+                    break
+                expired = time.time() - self.created[idx] > SEMANTIC_CACHE_TTL_SECONDS
+                if self.features[idx] == feature and not expired:
+                    return self.responses[idx]
+        return None
+
+    def add(self, vector, feature, response):
+        """Store a response under the embedding of the question that produced it"""
+        with self._lock:
+            if self.index is None:
+                self.index = faiss.IndexFlatIP(vector.shape[1])
+            self._evict_expired()
+            self.index.add(vector)
+            self.features.append(feature)
+            self.responses.append(response)
+            self.created.append(time.time())
+
+    def save(self, index_path, data_path):
+        """Write the index and its response table to disk"""
+        with self._lock:
+            if self.index is None:
+                return
+            self._evict_expired()
+            faiss.write_index(self.index, index_path)
+            with open(data_path, "wb") as f:
+                f.write(orjson.dumps({
+                    "model": EMBEDDING_MODEL,
+                    "features": self.features,
+                    "responses": self.responses,
+                    "created": self.created
+                }))
+
+def prewarm_semantic_cache(cache, warm_answers):
+    """Seed the cache with an answer to every sample prompt the picker offers
+
+    Answers come from the deploy-time warm cache where it has them, so only
+    the prompts themselves are embedded; the rest are generated.
+    """
+    pairs = OFFERED_SAMPLE_PROMPTS
+    try:
+        vectors = embed_texts(prompt for _, prompt in pairs)
+    except Exception:
+        logger.warning("Skipping semantic cache pre-warm: embedding failed", exc_info=True)
+        return
+
+    answers = [warm_answers.get(warm_cache_key(feature_id, prompt)) for feature_id, prompt in pairs]
+    missing = [row for row, answer in enumerate(answers) if answer is None]
+    if missing:
+        requests = [build_request(pairs[row][1], pairs[row][0]) for row in missing]
+        runner = get_gemini_runner()
+
+        # Each request gets its own timeout once it has a concurrency slot; a
+        # single timeout for the whole batch would lose every answer at once
+        async def answer_all():
+            return await asyncio.gather(
+                *(
+                    runner.limit(asyncio.wait_for(
+                        request_model.generate_content_async(contents),
+                        GEMINI_TIMEOUT
+                    ))
+                    for request_model, contents in requests
+                ),
+                return_exceptions=True
+            )
+
+        for row, response in zip(missing, run_async(answer_all(), timeout=None)):
+            if isinstance(response, Exception):
+                continue
+            try:
+                answers[row] = response.text
+            except Exception:
+                continue
+
+    seeded = 0
+    for row, ((feature_id, _), answer) in enumerate(zip(pairs, answers)):
+        if answer is None:
+            continue
+        cache.add(vectors[row:row + 1], feature_id, answer)
+        seeded += 1
+    logger.info(
+        "Pre-warmed semantic cache with %d of %d sample prompts (%d generated)",
+        seeded, len(pairs), len(missing)
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_semantic_cache():
+    """Process-wide semantic cache, persisted to disk on shutdown"""
+    cache = SemanticCache.load(SEMANTIC_CACHE_INDEX_PATH, SEMANTIC_CACHE_DATA_PATH)
+    atexit.register(cache.save, SEMANTIC_CACHE_INDEX_PATH, SEMANTIC_CACHE_DATA_PATH)
+    if not cache:
+        threading.Thread(
+            target=prewarm_semantic_cache,
+            args=(cache, get_warm_cache()),
+            daemon=True
+        ).start()
+    return cache
+
+# =============================================================================
+# ASYNC GEMINI EXECUTION
+# =============================================================================
+
+class GeminiRunner:
+    """Background event loop shared by all sessions, capping concurrent Gemini requests"""
+
+    def __init__(self, max_concurrency):
+        self.loop = asyncio.new_event_loop()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        threading.Thread(target=self.loop.run_forever, name="gemini-event-loop", daemon=True).start()
+
+    async def limit(self, awaitable):
+        """Await a Gemini call once one of the concurrency slots is free"""
+        async with self.semaphore:
+            return await awaitable
+
+    def submit(self, coro):
+        """Schedule a coroutine on the loop and return its concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_runner():
+    """Process-wide runner for Gemini calls"""
+    return GeminiRunner(GEMINI_MAX_CONCURRENCY)
+
+def run_async(coro, timeout=GEMINI_TIMEOUT):
+    """Run a coroutine on the shared event loop and wait for its result"""
+    future = get_gemini_runner().submit(coro)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+def iterate_async(async_iterable, timeout=GEMINI_TIMEOUT):
+    """Consume a Gemini stream on the shared event loop, yielding its items in this thread
+
+    Until an item arrives an empty string is yielded every STREAM_POLL_SECONDS,
+    so the consumer can make a Streamlit call and let a rerun stop it.
+    """
+    runner = get_gemini_runner()
+    items = queue.Queue()
+    done = object()
+
+    async def pump():
+        try:
+            async with runner.semaphore:
+                async for item in async_iterable:
+                    items.put((item, None))
+        except Exception as e:
+            items.put((None, e))
+        finally:
+            items.put((done, None))
+
+    future = runner.submit(pump())
+    try:
+        last_item_at = time.monotonic()
+        while True:
+            try:
+                item, error = items.get(timeout=STREAM_POLL_SECONDS)
+            except queue.Empty:
+                if time.monotonic() - last_item_at >= timeout:
+                    raise TimeoutError(f"No response from Gemini within {timeout} seconds")
+                yield ""
+                continue
+            last_item_at = time.monotonic()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        # Stop the stream and free its concurrency slot if the consumer gave
+        # up early, e.g. the user clicked something and Streamlit reran
+        future.cancel()
+
 # =============================================================================
 # AI RESPONSE GENERATION
 # =============================================================================
 
 def generate_system_prompt(feature=None):
-    """Generate system prompt based on selected feature"""
-    base_prompt = """You are AgroNova, an expert AI agricultural assistant helping farmers worldwide. 
-You provide practical, actionable farming advice based on scientific principles and regional best practices.
-
-Your expertise includes:
-- Crop recommendations based on location, season, soil type, and climate
-- Pest and disease identification and management (organic and chemical solutions)
-- Weather-based farming advice and planning
-- Soil health and fertilizer recommendations
-- Sustainable and organic farming practices
-
-Always provide:
-1. Clear, structured responses with practical steps
-2. Region-specific advice when location is mentioned
-3. Both organic and conventional solutions when applicable
-4. Safety warnings for chemical applications
-5. Preventive measures alongside treatments
-
-Format your responses with:
-- Clear headings using **bold** for main points
-- Bullet points for lists
-- Emojis for visual appeal (🌾 🐛 💧 🌱 etc.)
-- Specific measurements and timings
-- Action-oriented language
-
-Keep responses concise but comprehensive, typically 200-400 words unless detailed technical information is requested."""
-
-    feature_contexts = {
-        "crop-recommendation": "\n\nFocus on: Suggesting appropriate crops based on soil type, climate, season, water availability, and market demand. Include planting times, expected yields, and care requirements.",
-        "pest-disease": "\n\nFocus on: Identifying pests and diseases from descriptions, providing both organic and chemical treatment options, preventive measures, and application guidelines.",
-        "weather-alerts": "\n\nFocus on: Providing weather-based farming advice, irrigation scheduling, harvest timing, and crop protection strategies during different weather conditions.",
-        "soil-fertilizer": "\n\nFocus on: Soil health assessment, pH management, nutrient deficiency identification, fertilizer recommendations (NPK ratios), and organic soil improvement methods.",
-        "sustainable-farming": "\n\nFocus on: Eco-friendly pest control, organic farming practices, companion planting, water conservation, biodiversity, and certification guidance."
+    """Look up the system prompt for the selected feature"""
+    return SYSTEM_PROMPTS.get(feature, BASE_SYSTEM_PROMPT)
+
+@st.cache_resource(show_spinner=False)
+def get_models():
+    """One model per feature with its system prompt set as the system instruction"""
+    genai = get_genai()
+    return {
+        feature_id: genai.GenerativeModel(
+            model_name=MODEL_NAME,
+            generation_config=GENERATION_CONFIG,
+            system_instruction=generate_system_prompt(feature_id),
+        )
+        for feature_id in [None, *(feature.id for feature in FEATURES)]
     }
-    
-    if feature and feature in feature_contexts:
-        return base_prompt + feature_contexts[feature]
-    return base_prompt
 
-@st.cache_data(show_spinner=False)
-def get_ai_response(user_message, feature=None, _chat_history=None):
-    """Generate AI response using Gemini API"""
-    try:
-        conversation = []
-        
-        system_prompt = generate_system_prompt(feature)
-        conversation.append({
-            "role": "user",
-            "parts": [system_prompt]
-        })
-        conversation.append({
-            "role": "model",
-            "parts": ["I understand. I'm AgroNova, your agricultural assistant. I'll provide practical, region-specific farming advice with clear formatting and actionable steps."]
-        })
-        
-        if _chat_history:
-            for msg in _chat_history[-6:]:
-                role = "user" if msg["role"] == "user" else "model"
-                conversation.append({
-                    "role": role,
-                    "parts": [msg["content"]]
-                })
-        
-        chat = model.start_chat(history=conversation)
-        response = chat.send_message(user_message)
-        
-        return response.text
-        
-    except Exception as e:
-        error_msg = f"""**Error Processing Request**
+def build_request(user_message, feature=None, chat_history=None):
+    """Return the model to call and the conversation contents to send it"""
+    conversation = []
+    
+    models = get_models()
+    request_model = models.get(feature, models[None])
+    
+    if chat_history:
+        for role, content in chat_history:
+            conversation.append({
+                "role": "user" if role == "user" else "model",
+                "parts": [content]
+            })
+    
+    conversation.append({
+        "role": "user",
+        "parts": [user_message]
+    })
+    return request_model, conversation
+
+async def generate_stream_async(request_model, conversation):
+    """Yield response text chunks from a streaming Gemini request"""
+    response = await request_model.generate_content_async(conversation, stream=True)
+    async for chunk in response:
+        yield chunk.text
+
+def format_error(error):
+    """Build the chat message shown when a Gemini request fails"""
+    return f"""**Error Processing Request**
 
 I encountered an issue generating a response. This could be due to:
 - API key not configured properly
@@ -239,9 +559,147 @@ I encountered an issue generating a response. This could be due to:
 2. You have an active internet connection
 3. Your API key has sufficient quota
 
-Error details: {str(e)}"""
-        return error_msg
+Error details: {str(error)}"""
+
+def response_key(user_message, feature=None, chat_history=None):
+    """Hash everything that determines a response into a compact cache key"""
+    # Case and spacing differences don't change the answer
+    question = " ".join(user_message.split()).casefold()
+    return hashlib.blake2b(
+        orjson.dumps([feature, question, chat_history or []]),
+        digest_size=16
+    ).digest()
+
+def stream_ai_response(user_message, feature=None, chat_history=None):
+    """Yield the AI response in chunks as Gemini produces them
+
+    chat_history holds the earlier (role, content) pairs to send as
+    context, as built by chat_context().
+    """
+    key = response_key(user_message, feature, chat_history)
+    cached = get_exact_cache().get(key)
+    if cached is not None:
+        yield cached
+        return
+    
+    # Once the user has asked something earlier the reply depends on the
+    # conversation, so only first questions use the warm and semantic caches
+    first_question = not any(role == "user" for role, _ in (chat_history or []))
+    if first_question:
+        cached = get_warm_cache().get(warm_cache_key(feature, user_message))
+        if cached is not None:
+            yield cached
+            return
+    
+    query_vector = None
+    if first_question:
+        semantic_cache = get_semantic_cache()
+        try:
+            query_vector = embed_text(user_message)
+        except Exception:
+            logger.warning("Embedding failed; skipping semantic cache", exc_info=True)
+            query_vector = None
+        if query_vector is not None:
+            cached = semantic_cache.lookup(query_vector, feature)
+            if cached is not None:
+                get_exact_cache().put(key, cached)
+                yield cached
+                return
+    
+    # Identical requests arriving while this one is answered wait for it,
+    # and take over if the session answering it goes away first
+    waiting_since = time.monotonic()
+    while True:
+        inflight, is_leader = get_inflight_requests().claim(key)
+        if is_leader:
+            break
+        if not concurrent.futures.wait([inflight], timeout=STREAM_POLL_SECONDS).done:
+            if time.monotonic() - waiting_since >= GEMINI_TIMEOUT:
+                yield format_error(TimeoutError(f"No response from Gemini within {GEMINI_TIMEOUT} seconds"))
+                return
+            # Like iterate_async, hand control back so a rerun can stop the wait
+            yield ""
+            continue
+        try:
+            response_text = inflight.result()
+        except RequestInterrupted:
+            waiting_since = time.monotonic()
+            continue
+        except Exception as e:
+            yield format_error(e)
+            return
+        yield response_text
+        return
+
+    chunks = []
+    try:
+        request_model, conversation = build_request(user_message, feature, chat_history)
+        for chunk in iterate_async(generate_stream_async(request_model, conversation)):
+            chunks.append(chunk)
+            yield chunk
+    except Exception as e:
+        logger.exception("Gemini request failed")
+        inflight.set_exception(e)
+        yield format_error(e)
+    else:
+        # The whole answer has been shown, so failing to cache it is only logged
+        response_text = "".join(chunks)
+        try:
+            get_exact_cache().put(key, response_text)
+            if query_vector is not None:
+                semantic_cache.add(query_vector, feature, response_text)
+        except Exception:
+            logger.warning("Could not cache the response", exc_info=True)
+        inflight.set_result(response_text)
+    finally:
+        # Released first so that waiting requests can claim the key again
+        get_inflight_requests().release(key, inflight)
+        # The consumer stopped iterating (e.g. a rerun) before the reply finished
+        if not inflight.done():
+            inflight.set_exception(RequestInterrupted())
+
+# =============================================================================
+# CHAT HISTORY
+# =============================================================================
 
+def summarize_questions(roles, contents):
+    """Condense the user's questions among the given messages into a one-line note"""
+    questions = [
+        content.strip()[:SUMMARY_QUESTION_CHARS]
+        for role, content in zip(roles, contents)
+        if role == "user"
+    ]
+    if not questions:
+        return ""
+    return "Earlier in this conversation the farmer asked about: " + "; ".join(questions[-SUMMARY_MAX_QUESTIONS:])
+
+def chat_context():
+    """Context for the next question: the summary of older turns plus the most recent messages
+
+    The welcome message is not part of the conversation. Leaving it out
+    also sends a first question exactly as the pre-warm and
+    scripts/warm_cache.py send the sample prompts.
+    """
+    recent = list(zip(
+        st.session_state.roles[1:][-HISTORY_WINDOW:],
+        st.session_state.contents[1:][-HISTORY_WINDOW:]
+    ))
+    if st.session_state.history_summary:
+        return [("assistant", st.session_state.history_summary), *recent]
+    return recent
+
+def add_message(role, content):
+    """Append a message to the conversation"""
+    st.session_state.roles.append(role)
+    st.session_state.contents.append(content)
+
+def record_reply(reply):
+    """Append an assistant reply and fold messages that left the window into the summary"""
+    add_message("assistant", reply)
+    st.session_state.history_summary = summarize_questions(
+        st.session_state.roles[:-HISTORY_WINDOW],
+        st.session_state.contents[:-HISTORY_WINDOW]
+    )
 
 # =============================================================================
 # UI COMPONENTS (PURE PYTHON)
@@ -249,12 +707,8 @@ Error details: {str(e)}"""
 
 def render_header():
     """Render the header using native Streamlit components"""
-    # Create a colored container using columns and containers
-    header_container = st.container()
-    with header_container:
-        st.markdown("# 🌾 AgroNova")
-        st.markdown("#### Smart Farming Assistant powered by Gemini AI")
-        st.markdown("---")
+    # A single markdown element rather than a container of three
+    st.markdown(HEADER_MARKDOWN)
 
 def render_sidebar():
     """Render the sidebar with features"""
@@ -262,31 +716,15 @@ def render_sidebar():
         st.markdown("### 📋 Features")
         st.caption("Select a feature to get specialized advice:")
         
-        for feature in FEATURES:
-            is_selected = st.session_state.selected_feature == feature["id"]
-            
-            # Create a container for each feature
-            with st.container():
-                if st.button(
-                    feature['title'],
-                    key=feature["id"],
-                    use_container_width=True,
-                    type="primary" if is_selected else "secondary",
-                    help=feature['description']
-                ):
-                    st.session_state.selected_feature = feature["id"]
-                    st.rerun()
-                
-                if is_selected:
-                    st.success(feature['description'])
-                else:
-                    st.caption(feature['description'])
-        
-        if st.session_state.selected_feature:
-            st.markdown("")
-            if st.button("🔄 Clear Selection", use_container_width=True):
-                st.session_state.selected_feature = None
-                st.rerun()
+        # One widget bound to session state; selecting an option reruns on its own
+        st.radio(
+            "Features",
+            options=[None, *FEATURE_TITLES],
+            format_func=lambda feature_id: FEATURE_TITLES.get(feature_id, GENERAL_FEATURE_TITLE),
+            captions=[GENERAL_FEATURE_CAPTION, *(feature.description for feature in FEATURES)],
+            key="selected_feature",
+            label_visibility="collapsed"
+        )
         
         st.divider()
         
@@ -300,89 +738,112 @@ def render_sidebar():
         st.caption("Built with Streamlit & Gemini AI")
 
 def render_sample_prompts():
-    """Render sample prompts using native Streamlit components"""
+    """Render sample prompts using native Streamlit components; returns the submitted prompt"""
     st.markdown("### ✨ Try These Sample Questions")
     
     if st.session_state.selected_feature:
-        prompts = SAMPLE_PROMPTS.get(st.session_state.selected_feature, [])
+        prompts = SAMPLE_PROMPTS.get(st.session_state.selected_feature, ())
     else:
-        prompts = []
-        for prompt_list in SAMPLE_PROMPTS.values():
-            prompts.extend(prompt_list[:2])
+        prompts = DEFAULT_SAMPLE_PROMPTS
+    
+    # A single form: choosing a question doesn't rerun anything until it is submitted
+    with st.form("sample_prompts", clear_on_submit=True, border=False):
+        choice = st.selectbox(
+            "Sample question",
+            prompts[:SAMPLE_PROMPT_LIMIT],
+            index=None,
+            placeholder="Choose a sample question...",
+            label_visibility="collapsed"
+        )
+        submitted = st.form_submit_button("Ask ✨", type="primary")
+    
+    return choice if submitted else None
+
+def answer_question(question, container):
+    """Add the question to the chat and stream the reply into container as it arrives"""
+    roles, contents = st.session_state.roles, st.session_state.contents
+    
+    # A rerun interrupted the previous question before it was answered.
+    # Drop it, so that it is neither left unanswered in the chat nor sent
+    # as context, where it would also make this look like a follow-up
+    if roles[-1] == "user":
+        roles.pop()
+        contents.pop()
+    
+    context = chat_context()
+    add_message("user", question)
+    
+    with container:
+        with st.chat_message("user", avatar=AVATARS["user"]):
+            st.markdown(question)
+        with st.chat_message("assistant", avatar=AVATARS["assistant"]):
+            placeholder = st.empty()
+            placeholder.caption("🤔 Thinking...")
+            chunks = []
+            for chunk in stream_ai_response(
+                question,
+                st.session_state.selected_feature,
+                context
+            ):
+                chunks.append(chunk)
+                # Empty chunks arrive while Gemini is still working; redrawing
+                # on those too lets Streamlit stop this run once the user moves on
+                reply = "".join(chunks)
+                if reply:
+                    placeholder.markdown(reply)
+                else:
+                    placeholder.caption("🤔 Thinking...")
     
-    cols = st.columns(2)
-    for idx, prompt in enumerate(prompts[:8]):
-        with cols[idx % 2]:
-            if st.button(prompt, key=f"prompt_{idx}", use_container_width=True):
-                st.session_state.messages.append({"role": "user", "content": prompt})
-                with st.spinner("🤔 Thinking..."):
-                    response = get_ai_response(
-                        prompt, 
-                        st.session_state.selected_feature,
-                        st.session_state.messages
-                    )
-                st.session_state.messages.append({"role": "assistant", "content": response})
-                st.rerun()
+    record_reply("".join(chunks))
 
 # =============================================================================
 # MAIN APP
 # =============================================================================
 
-def main():
-    render_header()
-    render_sidebar()
-    
-    # Chat interface
+def clear_chat():
+    """Reset the conversation to the welcome message"""
+    st.session_state.roles = st.session_state.roles[:1]
+    st.session_state.contents = st.session_state.contents[:1]
+    st.session_state.history_summary = ""
+
+@st.fragment
+def render_chat():
+    """Render the conversation and sample prompts; reruns on its own when its widgets are used"""
     st.markdown("### 💬 Chat with AgroNova")
     
     # Display chat messages using native Streamlit chat components
     chat_container = st.container()
     with chat_container:
-        for message in st.session_state.messages:
-            if message["role"] == "user":
-                with st.chat_message("user", avatar="👤"):
-                    st.write(message["content"])
-            else:
-                with st.chat_message("assistant", avatar="🌾"):
-                    st.write(message["content"])
-    
-    # Chat input
-    st.divider()
-    
-    user_input = st.text_area(
-        "Ask me anything about farming...",
-        key="user_input",
-        placeholder="e.g., What crops should I grow in July in Tamil Nadu?",
-        height=100
-    )
-    
-    col1, col2 = st.columns([6, 1])
-    with col2:
-        send_button = st.button("Send 📤", use_container_width=True, type="primary")
-    
-    if send_button and user_input.strip():
-        st.session_state.messages.append({"role": "user", "content": user_input})
-        
-        with st.spinner("🤔 Thinking..."):
-            response = get_ai_response(
-                user_input,
-                st.session_state.selected_feature,
-                st.session_state.messages
-            )
-        
-        st.session_state.messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        for role, content in zip(st.session_state.roles, st.session_state.contents):
+            with st.chat_message(role, avatar=AVATARS[role]):
+                st.markdown(content)
     
     # Sample prompts
     st.divider()
-    render_sample_prompts()
+    sample_prompt = render_sample_prompts()
+    
+    # The reply is drawn in place as it streams, so no rerun is needed afterwards
+    question = st.session_state.pop("pending_question", None) or sample_prompt
+    if question:
+        answer_question(question, chat_container)
     
     # Clear chat button
-    if len(st.session_state.messages) > 1:
+    if len(st.session_state.roles) > 1:
         st.divider()
-        if st.button("🗑️ Clear Chat History", type="secondary"):
-            st.session_state.messages = [st.session_state.messages[0]]
-            st.rerun()
+        st.button("🗑️ Clear Chat History", type="secondary", on_click=clear_chat)
+
+def main():
+    # Load (or start pre-warming) the semantic cache before the first question
+    get_semantic_cache()
+    render_header()
+    render_sidebar()
+    
+    # Chat input, pinned to the bottom of the page
+    user_input = st.chat_input("Ask me anything about farming...")
+    if user_input and user_input.strip():
+        st.session_state.pending_question = user_input
+    
+    render_chat()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,193 @@
+"""
+Static feature and sample-prompt data for the Smart Farming Assistant.
+
+Kept out of app.py because Streamlit re-executes the app script on every
+rerun, while an imported module is built once per process. It is also
+safe to import outside Streamlit, so scripts/warm_cache.py shares the
+model settings defined here.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from types import MappingProxyType
+
+# =============================================================================
+# DATA STRUCTURES
+# =============================================================================
+
+@dataclass(frozen=True, slots=True)
+class Feature:
+    """A selectable assistant feature and its sample prompts"""
+    id: str
+    title: str
+    description: str
+    color: str
+    prompts: tuple
+    # Answers depend on current conditions, so they must not be precomputed
+    time_sensitive: bool = False
+
+FEATURES = tuple(Feature(**feature) for feature in [
+    {
+        "id": "crop-recommendation",
+        "title": "🌾 Crop Recommendation",
+        "description": "Get suggestions for crops based on your location, season, and soil type",
+        "color": "#d1fae5",
+        "prompts": (
+            "Suggest crops to plant in July in Tamil Nadu",
+            "What should I grow in acidic soil in Odisha in September?",
+            "Best crops for monsoon season in Kerala",
+            "Crop recommendation for sandy soil in Rajasthan"
+        )
+    },
+    {
+        "id": "pest-disease",
+        "title": "🐛 Pest & Disease Management",
+        "description": "Identify and treat crop diseases and pest infestations",
+        "color": "#fee2e2",
+        "prompts": (
+            "White fungus on wheat leaves in Haryana – treatment?",
+            "How to treat aphids on tomato plants organically?",
+            "Yellow spots on rice leaves - what is it?",
+            "Pest control for cotton crops in Maharashtra"
+        )
+    },
+    {
+        "id": "weather-alerts",
+        "title": "🌦️ Weather-Based Alerts",
+        "description": "Get weather forecasts and farming advice based on conditions",
+        "color": "#dbeafe",
+        "time_sensitive": True,
+        "prompts": (
+            "Rain prediction and farming advice for Punjab this week?",
+            "Weather forecast for harvesting season in Karnataka",
+            "Should I irrigate my crops this week in Gujarat?",
+            "Best time to apply fertilizer based on weather in UP"
+        )
+    },
+    {
+        "id": "soil-fertilizer",
+        "title": "🌱 Soil & Fertilizer Advice",
+        "description": "Receive recommendations for soil treatment and fertilization",
+        "color": "#fef3c7",
+        "prompts": (
+            "What should I grow in slightly acidic soil in Kenya?",
+            "NPK fertilizer ratio for wheat cultivation",
+            "How to improve clay soil for vegetable farming?",
+            "Organic fertilizer recommendations for sugarcane"
+        )
+    },
+    {
+        "id": "sustainable-farming",
+        "title": "♻️ Sustainable Farming Tips",
+        "description": "Learn eco-friendly and organic farming practices",
+        "color": "#d1fae5",
+        "prompts": (
+            "Give eco-friendly pest control methods for grapes in Italy",
+            "Organic farming practices for small-scale farmers",
+            "Water conservation techniques for paddy fields",
+            "Companion planting guide for vegetables"
+        )
+    }
+])
+
+# Lookup tables derived from FEATURES; read-only views since they are
+# shared by every session in the process
+SAMPLE_PROMPTS = MappingProxyType({feature.id: feature.prompts for feature in FEATURES})
+FEATURE_TITLES = MappingProxyType({feature.id: feature.title for feature in FEATURES})
+
+# Sample prompts shown when no feature is selected
+DEFAULT_SAMPLE_PROMPTS = tuple(
+    prompt
+    for feature in FEATURES
+    for prompt in feature.prompts[:2]
+)
+
+# Most sample prompts the picker offers at once
+SAMPLE_PROMPT_LIMIT = 8
+
+# Every (feature, prompt) pair the picker can submit; the defaults are
+# asked with no feature selected
+OFFERED_SAMPLE_PROMPTS = (
+    *((None, prompt) for prompt in DEFAULT_SAMPLE_PROMPTS[:SAMPLE_PROMPT_LIMIT]),
+    *(
+        (feature.id, prompt)
+        for feature in FEATURES
+        for prompt in feature.prompts[:SAMPLE_PROMPT_LIMIT]
+    ),
+)
+
+# Offered prompts whose answers don't go stale, which scripts/warm_cache.py
+# answers at deploy time; matched on the prompt text so that weather
+# prompts among the defaults are left out too
+TIME_SENSITIVE_PROMPTS = frozenset(
+    prompt
+    for feature in FEATURES
+    if feature.time_sensitive
+    for prompt in feature.prompts
+)
+WARM_CACHE_PROMPTS = tuple(
+    (feature_id, prompt)
+    for feature_id, prompt in OFFERED_SAMPLE_PROMPTS
+    if prompt not in TIME_SENSITIVE_PROMPTS
+)
+
+# =============================================================================
+# SYSTEM PROMPTS
+# =============================================================================
+
+BASE_SYSTEM_PROMPT = """You are AgroNova, an expert AI agricultural assistant helping farmers worldwide. 
+You provide practical, actionable farming advice based on scientific principles and regional best practices.
+
+Your expertise includes:
+- Crop recommendations based on location, season, soil type, and climate
+- Pest and disease identification and management (organic and chemical solutions)
+- Weather-based farming advice and planning
+- Soil health and fertilizer recommendations
+- Sustainable and organic farming practices
+
+Always provide:
+1. Clear, structured responses with practical steps
+2. Region-specific advice when location is mentioned
+3. Both organic and conventional solutions when applicable
+4. Safety warnings for chemical applications
+5. Preventive measures alongside treatments
+
+Format your responses with:
+- Clear headings using **bold** for main points
+- Bullet points for lists
+- Emojis for visual appeal (🌾 🐛 💧 🌱 etc.)
+- Specific measurements and timings
+- Action-oriented language
+
+Keep responses concise but comprehensive, typically 200-400 words unless detailed technical information is requested."""
+
+FEATURE_CONTEXTS = MappingProxyType({
+    "crop-recommendation": "\n\nFocus on: Suggesting appropriate crops based on soil type, climate, season, water availability, and market demand. Include planting times, expected yields, and care requirements.",
+    "pest-disease": "\n\nFocus on: Identifying pests and diseases from descriptions, providing both organic and chemical treatment options, preventive measures, and application guidelines.",
+    "weather-alerts": "\n\nFocus on: Providing weather-based farming advice, irrigation scheduling, harvest timing, and crop protection strategies during different weather conditions.",
+    "soil-fertilizer": "\n\nFocus on: Soil health assessment, pH management, nutrient deficiency identification, fertilizer recommendations (NPK ratios), and organic soil improvement methods.",
+    "sustainable-farming": "\n\nFocus on: Eco-friendly pest control, organic farming practices, companion planting, water conservation, biodiversity, and certification guidance."
+})
+
+# Complete system prompt for each feature, plus None for general questions
+SYSTEM_PROMPTS = MappingProxyType({
+    None: BASE_SYSTEM_PROMPT,
+    **{feature_id: BASE_SYSTEM_PROMPT + context for feature_id, context in FEATURE_CONTEXTS.items()}
+})
+
+# =============================================================================
+# MODEL SETTINGS
+# =============================================================================
+
+MODEL_NAME = "gemini-2.5-flash"
+
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.95,
+    "top_k": 40,
+    "max_output_tokens": 2048,
+}
+
+def warm_cache_key(feature, prompt):
+    """Key of a sample prompt's answer in warm_cache.json"""
+    return hashlib.sha1(f"{feature or ''}\n{prompt}".encode()).hexdigest()
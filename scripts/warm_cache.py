@@ -0,0 +1,72 @@
+"""
+Precompute answers to the sample prompts for the app's warm cache
+
+Time-sensitive prompts, such as this week's weather, are skipped; the app
+answers those live so that they expire with its other caches.
+
+Usage (from the repository root, before deploying):
+python scripts/warm_cache.py
+
+The API key is read from the GEMINI_API_KEY environment variable, falling
+back to .streamlit/secrets.toml. Answers are written to warm_cache.json,
+which app.py loads at startup.
+"""
+
+import os
+import sys
+import tomllib
+from pathlib import Path
+
+import google.generativeai as genai
+import orjson
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from farming_data import (  # noqa: E402
+    GENERATION_CONFIG,
+    MODEL_NAME,
+    SYSTEM_PROMPTS,
+    WARM_CACHE_PROMPTS,
+    warm_cache_key,
+)
+
+OUTPUT_PATH = ROOT / "warm_cache.json"
+SECRETS_PATH = ROOT / ".streamlit" / "secrets.toml"
+
+def load_api_key():
+    """API key from the environment, or from the app's Streamlit secrets"""
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key and SECRETS_PATH.exists():
+        with open(SECRETS_PATH, "rb") as f:
+            api_key = tomllib.load(f).get("GEMINI_API_KEY")
+    if not api_key:
+        sys.exit(f"Set GEMINI_API_KEY or add it to {SECRETS_PATH}")
+    return api_key
+
+def main():
+    genai.configure(api_key=load_api_key())
+    models = {
+        feature: genai.GenerativeModel(
+            model_name=MODEL_NAME,
+            generation_config=GENERATION_CONFIG,
+            system_instruction=system_prompt
+        )
+        for feature, system_prompt in SYSTEM_PROMPTS.items()
+    }
+
+    answers = {}
+    for feature, prompt in WARM_CACHE_PROMPTS:
+        print(f"[{feature or 'general'}] {prompt}")
+        try:
+            response = models[feature].generate_content(prompt)
+            answers[warm_cache_key(feature, prompt)] = response.text
+        except Exception as e:
+            # A missing answer just falls through to a live request in the app
+            print(f"  skipped: {e}", file=sys.stderr)
+
+    OUTPUT_PATH.write_bytes(orjson.dumps(answers, option=orjson.OPT_INDENT_2))
+    print(f"Wrote {len(answers)} answers to {OUTPUT_PATH}")
+
+if __name__ == "__main__":
+    main()